@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""Generate synthetic inputs, at production scale, for benchmarking the Python scripts.
+
+The generated files have the same shape as the real inputs of the scripts in `scripts/`:
+
+- `mutants-log`: a Major `mutants.log` file (input of `trim_mutants.py`).  The number of mutants
+  per method follows a Zipf-like distribution, so that a few methods have many mutants and most
+  methods have few, as in real subject programs.
+- `randoop-tests`: a directory of Randoop `RegressionTest<N>.java` files (input of
+  `convert_test_runners.py --mode randoop-to-evosuite`).
+- `evosuite-tests`: a directory of EvoSuite `<Class>_ESTest.java` files and their scaffolding
+  (input of `convert_test_runners.py --mode evosuite-to-randoop`).
+- `fig6-table3`, `table4`, `pipeline-profile`: results CSV files with the columns written by
+  `mutation-*.sh` and `defects4j-*.sh`, sized like a full GRT-paper sweep (inputs of
+  `experiment-scripts/generate-grt-figures.py`).
+
+All data is derived from a seeded random number generator, so the output is reproducible.
+The generators are used by `run_benchmarks.py`, and can also be run directly, e.g.:
+    python generate_benchmark_data.py mutants-log /tmp/mutants.log --size 1000000
+"""
+
+import argparse
+import csv
+import random
+from pathlib import Path
+
+# Mutation operators of Major, with a representative (original, replacement, source change).
+MAJOR_OPERATORS = {
+    "AOR": ("+", "-", "a + b |==> a - b"),
+    "COR": ("&&", "||", "a && b |==> a || b"),
+    "EVR": ("<IDENTIFIER(int)>", "0", "x |==> 0"),
+    "LOR": ("&", "|", "a & b |==> a | b"),
+    "LVR": ("TRUE", "FALSE", "true |==> false"),
+    "ORU": ("-(int)", "~(int)", "-a |==> ~a"),
+    "ROR": ("<(int,int)", "<=(int,int)", "a < b |==> a <= b"),
+    "SOR": ("<<", ">>", "a << 2 |==> a >> 2"),
+    "STD": ("<ASSIGN>", "<NO-OP>", "x = y; |==> <NO-OP>"),
+}
+
+# GRT-paper sweep parameters (see `experiment-scripts/mutation-fig6-table3.sh`).
+NUM_SUBJECT_PROGRAMS = 30
+SECONDS_PER_CLASS = [2, 10, 30, 60]
+NUM_LOOP = 10
+MUTATION_VERSIONS = [
+    "BASELINE",
+    "BLOODHOUND+ORIENTEERING+DETECTIVE+GRT_FUZZING+ELEPHANT_BRAIN+CONSTANT_MINING",
+    "EvoSuite",
+]
+
+# Defects4J sweep parameters (see `experiment-scripts/defects4j-table4.sh`).
+DEFECTS4J_BUGS = {"Chart": 26, "Lang": 65, "Math": 106, "Time": 27}
+DEFECTS4J_TOTAL_SECONDS = [120, 300, 600]
+DEFECTS4J_SOURCES = ["randoop", "grt", "evosuite"]
+
+# Stages recorded by `mutation-*.sh` (see `stage_start` in `defs.sh`), with typical mean seconds.
+PIPELINE_STAGES = {
+    "generate": 60.0,
+    "compile-subject": 20.0,
+    "trim-mutants": 1.0,
+    "trim-mutants:parse": 0.6,
+    "trim-mutants:select": 0.3,
+    "trim-mutants:write": 0.1,
+    "compile-tests": 15.0,
+    "coverage": 30.0,
+    "coverage-report": 3.0,
+    "mutation-analysis": 240.0,
+}
+
+
+def write_mutants_log(path, num_lines, skew=1.1, mutants_per_method=20, seed=0):
+    """Write a Major `mutants.log` file with a skewed number of mutants per method.
+
+    Each line has the layout parsed by `trim_mutants.parse_mutant_line`:
+    `id:operator:original:replacement:class@method:line:source change`.
+
+    Args:
+        path: Output file.
+        num_lines: Number of mutants (lines) to write.
+        skew: Exponent of the Zipf-like distribution of mutants over methods.
+        mutants_per_method: Average number of mutants per method.
+        seed: Seed for the random number generator.
+    """
+    rng = random.Random(seed)
+    num_methods = max(1, num_lines // mutants_per_method)
+    weights = [1 / (rank**skew) for rank in range(1, num_methods + 1)]
+    total_weight = sum(weights)
+    counts = [int(num_lines * weight / total_weight) for weight in weights]
+    counts[0] += num_lines - sum(counts)
+    rng.shuffle(counts)
+
+    operators = list(MAJOR_OPERATORS)
+    mutant_id = 1
+    with Path(path).open("w") as f:
+        for method_index, count in enumerate(counts):
+            class_name = f"org.example.pkg{method_index % 40}.Class{method_index // 12}"
+            method = f"{class_name}@method{method_index}(int,java.lang.String)"
+            source_line = 10 + method_index % 500
+            lines = []
+            for offset in range(count):
+                operator = rng.choice(operators)
+                original, replacement, change = MAJOR_OPERATORS[operator]
+                lines.append(
+                    f"{mutant_id}:{operator}:{original}:{replacement}:{method}:"
+                    f"{source_line + offset // 4}:{change}\n"
+                )
+                mutant_id += 1
+            f.writelines(lines)
+
+
+def write_randoop_tests(directory, num_files, tests_per_file=50):
+    """Write Randoop-style `RegressionTest<N>.java` files, as produced by `mutation-randoop.sh`.
+
+    Args:
+        directory: Output directory; created if it does not exist.
+        num_files: Number of test files to write.
+        tests_per_file: Number of test methods per file.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for file_index in range(num_files):
+        class_name = f"RegressionTest{file_index}"
+        lines = [
+            "import org.junit.FixMethodOrder;\n",
+            "import org.junit.Test;\n",
+            "import org.junit.runners.MethodSorters;\n",
+            "\n",
+            "@FixMethodOrder(MethodSorters.NAME_ASCENDING)\n",
+            f"public class {class_name} {{\n",
+            "\n",
+            "    public static boolean debug = false;\n",
+        ]
+        for test_index in range(tests_per_file):
+            reversed_index = str(test_index)[::-1]
+            lines += [
+                "\n",
+                "    @Test\n",
+                f"    public void test{test_index:03d}() throws Throwable {{\n",
+                "        if (debug)\n",
+                f'            System.out.format("%n%s%n", "{class_name}.test{test_index:03d}");\n',
+                f'        java.lang.StringBuilder sb0 = new StringBuilder("{test_index}");\n',
+                "        java.lang.StringBuilder sb1 = sb0.reverse();\n",
+                f'        org.junit.Assert.assertEquals("{reversed_index}", sb1.toString());\n',
+                "    }\n",
+            ]
+        lines.append("}\n")
+        with (directory / f"{class_name}.java").open("w", encoding="utf-8") as f:
+            f.writelines(lines)
+
+
+def write_evosuite_tests(directory, num_files, tests_per_file=20):
+    """Write EvoSuite-style `<Class>_ESTest.java` files, as produced by `mutation-evosuite.sh`.
+
+    Each test file is accompanied by its `<Class>_ESTest_scaffolding.java` file.
+
+    Args:
+        directory: Output directory; created if it does not exist.
+        num_files: Number of test files (not counting scaffolding files) to write.
+        tests_per_file: Number of test methods per file.
+    """
+    package_dir = Path(directory) / "org" / "example"
+    package_dir.mkdir(parents=True, exist_ok=True)
+    for file_index in range(num_files):
+        class_name = f"Class{file_index}_ESTest"
+        lines = [
+            "/*\n",
+            " * This file was automatically generated by EvoSuite\n",
+            " */\n",
+            "\n",
+            "package org.example;\n",
+            "\n",
+            "import org.junit.Test;\n",
+            "import static org.junit.Assert.*;\n",
+            "import org.evosuite.runtime.EvoRunner;\n",
+            "import org.evosuite.runtime.EvoRunnerParameters;\n",
+            "import org.junit.runner.RunWith;\n",
+            "\n",
+            (
+                "@RunWith(EvoRunner.class) @EvoRunnerParameters(mockJVMNonDeterminism = true, "
+                "useVFS = true, useVNET = true, resetStaticState = true, "
+                "separateClassLoader = true) \n"
+            ),
+            f"public class {class_name} extends {class_name}_scaffolding {{\n",
+        ]
+        for test_index in range(tests_per_file):
+            lines += [
+                "\n",
+                "  @Test(timeout = 4000)\n",
+                f"  public void test{test_index:02d}()  throws Throwable  {{\n",
+                f"      Class{file_index} class{file_index}_0 = new Class{file_index}();\n",
+                f"      int int0 = class{file_index}_0.compute({test_index});\n",
+                f"      assertEquals({test_index}, int0);\n",
+                "  }\n",
+            ]
+        lines.append("}\n")
+        with (package_dir / f"{class_name}.java").open("w", encoding="utf-8") as f:
+            f.writelines(lines)
+        with (package_dir / f"{class_name}_scaffolding.java").open("w", encoding="utf-8") as f:
+            f.write(
+                "package org.example;\n"
+                "\n"
+                "import org.evosuite.runtime.annotation.EvoSuiteClassExclude;\n"
+                "\n"
+                "@EvoSuiteClassExclude\n"
+                f"public class {class_name}_scaffolding {{\n"
+                "}\n"
+            )
+
+
+def write_fig6_table3_csv(path, seed=0):
+    """Write a `fig6-table3.csv`-shaped results file for a full GRT-paper sweep.
+
+    Args:
+        path: Output file.
+        seed: Seed for the random number generator.
+    """
+    rng = random.Random(seed)
+    with Path(path).open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            [
+                "Version",
+                "FileName",
+                "TimeLimit",
+                "Seed",
+                "InstructionCoverage",
+                "BranchCoverage",
+                "MutationScore",
+            ]
+        )
+        for time_limit in SECONDS_PER_CLASS:
+            for subject_index in range(NUM_SUBJECT_PROGRAMS):
+                for version in MUTATION_VERSIONS:
+                    for _ in range(NUM_LOOP):
+                        instruction_coverage = rng.uniform(20, 95)
+                        writer.writerow(
+                            [
+                                version,
+                                f"subject-{subject_index:02d}.jar",
+                                time_limit,
+                                0,
+                                f"{instruction_coverage:.2f}",
+                                f"{instruction_coverage * rng.uniform(0.6, 0.95):.2f}",
+                                f"{instruction_coverage * rng.uniform(0.4, 0.9):.2f}",
+                            ]
+                        )
+
+
+def write_table4_csv(path, seed=0):
+    """Write a `table4.csv`-shaped results file for a full Defects4J sweep.
+
+    Args:
+        path: Output file.
+        seed: Seed for the random number generator.
+    """
+    rng = random.Random(seed)
+    with Path(path).open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            [
+                "ProjectId",
+                "Version",
+                "TestSuiteSource",
+                "Test",
+                "TestClassification",
+                "NumTrigger",
+                "TimeLimit",
+            ]
+        )
+        for time_limit in DEFECTS4J_TOTAL_SECONDS:
+            for project, num_bugs in DEFECTS4J_BUGS.items():
+                for bug_id in range(1, num_bugs + 1):
+                    for source in DEFECTS4J_SOURCES:
+                        for _ in range(NUM_LOOP):
+                            classification = rng.choices(
+                                ["Pass", "Fail", "Broken"], weights=[70, 20, 10]
+                            )[0]
+                            writer.writerow(
+                                [
+                                    project,
+                                    f"{bug_id}f",
+                                    source,
+                                    f"{project}-{bug_id}f-{source}.tar.bz2",
+                                    classification,
+                                    rng.randint(1, 3) if classification == "Fail" else 0,
+                                    time_limit,
+                                ]
+                            )
+
+
+def write_pipeline_profile_csv(path, seed=0):
+    """Write a `pipeline-profile.csv`-shaped timing file for a full GRT-paper sweep.
+
+    Args:
+        path: Output file.
+        seed: Seed for the random number generator.
+    """
+    rng = random.Random(seed)
+    with Path(path).open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Version", "FileName", "TimeLimit", "Stage", "Seconds"])
+        for time_limit in SECONDS_PER_CLASS:
+            for subject_index in range(NUM_SUBJECT_PROGRAMS):
+                for version in MUTATION_VERSIONS:
+                    for _ in range(NUM_LOOP):
+                        for stage, mean_seconds in PIPELINE_STAGES.items():
+                            writer.writerow(
+                                [
+                                    version,
+                                    f"subject-{subject_index:02d}.jar",
+                                    time_limit,
+                                    stage,
+                                    f"{mean_seconds * rng.uniform(0.5, 1.5):.3f}",
+                                ]
+                            )
+
+
+def main():
+    """Write one kind of synthetic benchmark input."""
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic inputs for benchmarking the Python scripts"
+    )
+    parser.add_argument(
+        "kind",
+        choices=[
+            "mutants-log",
+            "randoop-tests",
+            "evosuite-tests",
+            "fig6-table3",
+            "table4",
+            "pipeline-profile",
+        ],
+        help="Kind of input to generate",
+    )
+    parser.add_argument("output", help="Output file (or directory, for test files)")
+    parser.add_argument(
+        "-n",
+        "--size",
+        type=int,
+        default=None,
+        help="Number of mutants (mutants-log, default: 1000000) "
+        "or test files (randoop-tests/evosuite-tests, default: 2000)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed for the random number generator (default: 0)"
+    )
+    args = parser.parse_args()
+
+    if args.kind == "mutants-log":
+        write_mutants_log(args.output, args.size or 1_000_000, seed=args.seed)
+    elif args.kind == "randoop-tests":
+        write_randoop_tests(args.output, args.size or 2000)
+    elif args.kind == "evosuite-tests":
+        write_evosuite_tests(args.output, args.size or 2000)
+    elif args.kind == "fig6-table3":
+        write_fig6_table3_csv(args.output, seed=args.seed)
+    elif args.kind == "table4":
+        write_table4_csv(args.output, seed=args.seed)
+    elif args.kind == "pipeline-profile":
+        write_pipeline_profile_csv(args.output, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
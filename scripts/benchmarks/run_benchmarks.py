@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""Benchmark the Python scripts on synthetic, production-scale inputs.
+
+Each benchmark runs one entry point (`trim_mutants.py`, `convert_test_runners.py`, or a target
+of `experiment-scripts/generate-grt-figures.py`) in a fresh subprocess, on inputs written by
+`generate_benchmark_data.py`, and records its wall time and peak resident set size (RSS).
+Inputs are generated before the timed run, and regenerated for every repetition when the entry
+point modifies them in place.
+
+The results are compared against a baseline file written by an earlier run with
+`--save-baseline`.  The script exits with status 1 if any benchmark is slower, or uses more
+memory, than its baseline by more than the configured threshold.  Baselines are specific to a
+machine, so record one before making a change and compare against it afterwards:
+    python run_benchmarks.py --save-baseline
+    (make the change)
+    python run_benchmarks.py
+
+Everything runs offline; the only requirements are Linux (for peak RSS) and, for the figure
+benchmarks, the dependencies of `generate-grt-figures.py`.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import generate_benchmark_data as data
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+def run_entry_point(command, cwd, log_file):
+    """Run a command in a subprocess and measure it.
+
+    Args:
+        command: The command to run, as a list of arguments.
+        cwd: Working directory of the subprocess.
+        log_file: File that receives the standard output and error of the subprocess.
+
+    Returns:
+        tuple: Wall time in seconds and peak RSS in KiB of the subprocess.
+    """
+    env = dict(os.environ)
+    env.pop("TIMING_FILE", None)  # Do not record pipeline stage markers while benchmarking.
+    with Path(log_file).open("w") as log:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=cwd, env=env, stdout=log, stderr=log)
+        _, status, rusage = os.wait4(process.pid, 0)
+        seconds = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+
+    if process.returncode != 0:
+        print(Path(log_file).read_text(), file=sys.stderr)
+        print(f"Error: command failed: {' '.join(map(str, command))}", file=sys.stderr)
+        sys.exit(2)
+
+    # On Linux, ru_maxrss is in KiB.
+    return seconds, rusage.ru_maxrss
+
+
+def trim_mutants_benchmark(num_lines):
+    """Return a benchmark of `trim_mutants.py` on a `mutants.log` file with `num_lines` mutants."""
+
+    def setup(work_dir, input_dir):
+        mutants_log = input_dir / f"mutants-{num_lines}.log"
+        if not mutants_log.exists():
+            data.write_mutants_log(mutants_log, num_lines)
+        command = [
+            sys.executable,
+            SCRIPTS_DIR / "trim_mutants.py",
+            mutants_log,
+            "-o",
+            work_dir / "exclude_mutants.txt",
+        ]
+        return command, work_dir
+
+    return f"trim-mutants-{num_lines}", setup
+
+
+def convert_test_runners_benchmark(mode, num_files):
+    """Return a benchmark of `convert_test_runners.py` in the given mode on `num_files` tests."""
+
+    def setup(work_dir, _input_dir):
+        test_dir = work_dir / "tests"
+        if mode == "randoop-to-evosuite":
+            data.write_randoop_tests(test_dir, num_files)
+        else:
+            data.write_evosuite_tests(test_dir, num_files)
+        command = [
+            sys.executable,
+            SCRIPTS_DIR / "convert_test_runners.py",
+            test_dir,
+            "--mode",
+            mode,
+        ]
+        return command, work_dir
+
+    return f"convert-{mode}-{num_files}", setup
+
+
+def figures_benchmark(figure, write_csv):
+    """Return a benchmark of `generate-grt-figures.py` for the given figure.
+
+    `generate-grt-figures.py` reads `../results/<figure>.csv` relative to its working directory,
+    so the benchmark runs it in a subdirectory of a directory that holds the generated CSV file.
+    """
+
+    def setup(work_dir, input_dir):
+        csv_file = input_dir / f"{figure}.csv"
+        if not csv_file.exists():
+            write_csv(csv_file)
+        results_dir = work_dir / "results"
+        results_dir.mkdir()
+        shutil.copy(csv_file, results_dir)
+        run_dir = work_dir / "experiment-scripts"
+        run_dir.mkdir()
+        command = [
+            sys.executable,
+            SCRIPTS_DIR / "experiment-scripts" / "generate-grt-figures.py",
+            figure,
+        ]
+        return command, run_dir
+
+    return f"figures-{figure}", setup
+
+
+def run_benchmarks(benchmarks, repeat):
+    """Run each benchmark `repeat` times.
+
+    Args:
+        benchmarks: List of (name, setup) pairs.  `setup(work_dir, input_dir)` writes the inputs
+            of one run and returns the command to run and its working directory.
+        repeat: Number of runs per benchmark.
+
+    Returns:
+        dict: Maps each benchmark name to the minimum wall time in seconds ("seconds") and the
+        maximum peak RSS in KiB ("max_rss_kb") over its runs.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="grt-benchmarks-") as tmp:
+        input_dir = Path(tmp) / "inputs"
+        input_dir.mkdir()
+        for name, setup in benchmarks:
+            times = []
+            peak_rss = []
+            for iteration in range(repeat):
+                work_dir = Path(tmp) / f"{name}-{iteration}"
+                work_dir.mkdir()
+                command, cwd = setup(work_dir, input_dir)
+                seconds, max_rss_kb = run_entry_point(command, cwd, work_dir / "output.log")
+                times.append(seconds)
+                peak_rss.append(max_rss_kb)
+                shutil.rmtree(work_dir)
+            results[name] = {"seconds": min(times), "max_rss_kb": max(peak_rss)}
+            print(f"{name:<45} {min(times):10.3f} s {max(peak_rss) / 1024:10.1f} MiB")
+    return results
+
+
+def find_regressions(results, baseline, time_threshold, memory_threshold):
+    """Compare benchmark results against a baseline.
+
+    Args:
+        results: Output of `run_benchmarks`.
+        baseline: Output of an earlier `run_benchmarks`.
+        time_threshold: Allowed relative increase of wall time, e.g. 0.25 for 25%.
+        memory_threshold: Allowed relative increase of peak RSS, e.g. 0.25 for 25%.
+
+    Returns:
+        list: One message per regression.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric, threshold in [("seconds", time_threshold), ("max_rss_kb", memory_threshold)]:
+            old = baseline[name][metric]
+            new = result[metric]
+            if old > 0 and new > old * (1 + threshold):
+                regressions.append(
+                    f"{name}: {metric} increased from {old:.3f} to {new:.3f} "
+                    f"(+{(new / old - 1) * 100:.1f}%, threshold {threshold * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main():
+    """Run the benchmarks and check them against the baseline."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Python scripts on synthetic, production-scale inputs"
+    )
+    parser.add_argument(
+        "--mutant-lines",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+        help="Sizes of the mutants.log files for trim_mutants.py "
+        "(default: 10000 100000 1000000; use 10000000 for the largest subjects)",
+    )
+    parser.add_argument(
+        "--test-files",
+        type=int,
+        default=2000,
+        help="Number of test files for convert_test_runners.py (default: 2000)",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="Runs per benchmark (default: 3)"
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default=None,
+        help="Only run benchmarks whose name contains this string",
+    )
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help="Baseline file (default: baseline.json in this directory)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Write the results to the baseline file instead of comparing against it",
+    )
+    parser.add_argument(
+        "--time-threshold",
+        type=float,
+        default=0.25,
+        help="Allowed relative increase of wall time over the baseline (default: 0.25)",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=0.25,
+        help="Allowed relative increase of peak RSS over the baseline (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    benchmarks = [trim_mutants_benchmark(num_lines) for num_lines in args.mutant_lines]
+    benchmarks += [
+        convert_test_runners_benchmark("randoop-to-evosuite", args.test_files),
+        convert_test_runners_benchmark("evosuite-to-randoop", args.test_files),
+        figures_benchmark("fig6-table3", data.write_fig6_table3_csv),
+        figures_benchmark("table4", data.write_table4_csv),
+        figures_benchmark("pipeline-profile", data.write_pipeline_profile_csv),
+    ]
+    if args.filter:
+        benchmarks = [(name, setup) for name, setup in benchmarks if args.filter in name]
+
+    results = run_benchmarks(benchmarks, args.repeat)
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline = {}
+        if baseline_path.exists():
+            baseline = json.loads(baseline_path.read_text())
+        baseline.update(results)
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to: {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; use --save-baseline to record one.")
+        return
+
+    regressions = find_regressions(
+        results,
+        json.loads(baseline_path.read_text()),
+        args.time_threshold,
+        args.memory_threshold,
+    )
+    if regressions:
+        print("\nPerformance regressions:", file=sys.stderr)
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)
+        sys.exit(1)
+    print("\nNo performance regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,8 @@ import os
 import re
 from pathlib import Path
 
+from stage_timer import stage_timer
+
 
 def main() -> None:
     """Convert test runners between Randoop and EvoSuite.
@@ -37,10 +39,11 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    if args.mode == "randoop-to-evosuite":
-        convert_randoop_to_evosuite_runner(args.test_dir)
-    elif args.mode == "evosuite-to-randoop":
-        convert_evosuite_to_randoop_runner(args.test_dir)
+    with stage_timer(f"convert-runners:{args.mode}"):
+        if args.mode == "randoop-to-evosuite":
+            convert_randoop_to_evosuite_runner(args.test_dir)
+        elif args.mode == "evosuite-to-randoop":
+            convert_evosuite_to_randoop_runner(args.test_dir)
 
 
 def convert_randoop_to_evosuite_runner(test_dir: str) -> None:
@@ -49,6 +49,43 @@ function require_csv_basename() {
   fi
 }
 
+# Record the start of a pipeline stage in the per-run timing file $TIMING_FILE.
+# Each marker is a line "Stage,Event,Timestamp" (seconds since the epoch).
+function stage_start() {
+  echo "$1,start,$(date +%s.%N)" >> "$TIMING_FILE"
+}
+
+# Record the end of a pipeline stage in the per-run timing file $TIMING_FILE.
+function stage_end() {
+  echo "$1,end,$(date +%s.%N)" >> "$TIMING_FILE"
+}
+
+# Print one CSV row "<prefix>,Stage,Seconds" per stage recorded in a timing file,
+# in the order the stages first started.  A stage that ran more than once is summed.
+function stage_durations() {
+  local markers="$1"
+  local prefix="$2"
+
+  awk -F, -v prefix="$prefix" '
+    NR > 1 && $2 == "start" {
+      start[$1] = $3
+      if (!($1 in total)) {
+        total[$1] = 0
+        order[++n] = $1
+      }
+    }
+    NR > 1 && $2 == "end" && ($1 in start) {
+      total[$1] += $3 - start[$1]
+      delete start[$1]
+    }
+    END {
+      for (i = 1; i <= n; i++) {
+        printf "%s,%s,%.3f\n", prefix, order[i], total[order[i]]
+      }
+    }
+  ' "$markers"
+}
+
 # Switch to Java 8.
 function usejdk8() {
   if [ -z "$JAVA8_HOME" ]; then
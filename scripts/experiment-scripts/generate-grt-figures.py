@@ -16,8 +16,15 @@ This script supports generation of the following figures:
 - Table IV: Number of real bugs detected by GRT, Randoop, and EvoSuite on four Defects4J projects
   under different time budgets (120s, 300s, 600s). Results are aggregated over 10 runs per fault.
 
+It also supports a figure that is not part of the paper:
+
+- Pipeline profile: Stacked bar charts showing how the wall time of a `mutation-randoop.sh` or
+  `mutation-evosuite.sh` iteration splits across its stages (test generation, compilation,
+  coverage, mutation analysis, ...), one chart per subject program.  It is generated from
+  `results/pipeline-profile.csv`, to which every iteration of those scripts appends.
+
 Usage (for reference only):
-    python generate-grt-figures.py { fig6-table3 | fig7 | fig8-9 | table4 }
+    python generate-grt-figures.py { fig6-table3 | fig7 | fig8-9 | table4 | pipeline-profile }
 """
 
 import argparse
@@ -32,12 +39,24 @@ import pandas as pd
 import seaborn as sns
 from matplotlib.backends.backend_pdf import PdfPages
 
+# Features that `mutation-randoop.sh` enables for full GRT.
+GRT_COMPONENTS = {
+    "BLOODHOUND",
+    "ORIENTEERING",
+    "DETECTIVE",
+    "GRT_FUZZING",
+    "ELEPHANT_BRAIN",
+    "CONSTANT_MINING",
+}
+
 
 def main():
     """Parse arguments, load and process data, and save the selected figure type."""
     parser = argparse.ArgumentParser(description="Generate figures from coverage data.")
     parser.add_argument(
-        "figure", choices=["fig6-table3", "fig7", "fig8-9", "table4"], help="Figure to generate"
+        "figure",
+        choices=["fig6-table3", "fig7", "fig8-9", "table4", "pipeline-profile"],
+        help="Figure to generate",
     )
     args = parser.parse_args()
 
@@ -45,6 +64,9 @@ def main():
 
     if args.figure == "table4":
         save_to_pdf(raw_df, args.figure)
+    elif args.figure == "pipeline-profile":
+        df = average_stage_times(raw_df)
+        save_to_pdf(df, args.figure)
     else:
         df = average_over_loops(raw_df)
         save_to_pdf(df, args.figure)
@@ -80,6 +102,25 @@ def average_over_loops(df: pd.DataFrame) -> pd.DataFrame:
     )
 
 
+def average_stage_times(df: pd.DataFrame) -> pd.DataFrame:
+    """Average per-stage wall times over repeated runs of the same configuration.
+
+    Sub-stages recorded by the Python scripts (named `<stage>:<phase>`, e.g. `trim-mutants:parse`)
+    are dropped, because their time is already included in the enclosing stage.
+
+    Args:
+        df: Raw per-stage timings, one row per (run, stage).
+
+    Returns:
+        Data averaged over repeated runs, retaining one row per (tool, timelimit, subject, stage).
+        Rows keep the order in which stages first appear, which is the order of the pipeline.
+    """
+    df = df[~df["Stage"].str.contains(":")]
+    return df.groupby(
+        ["Version", "TimeLimit", "FileName", "Stage"], as_index=False, sort=False
+    ).agg({"Seconds": "mean"})
+
+
 def generate_table_3(df: pd.DataFrame) -> mpl.figure.Figure:
     """Generate data for Table III: Average coverage and mutation scores per (tool, timelimit) pair.
 
@@ -312,12 +353,72 @@ def generate_table_4(df: pd.DataFrame) -> mpl.figure.Figure:
     return fig
 
 
+def short_version(version: str) -> str:
+    """Return a short label for a value of the Version column.
+
+    The full GRT feature list (e.g. `BLOODHOUND+ORIENTEERING+...+CONSTANT_MINING`) is too long for
+    an axis label, so it is shown as "GRT".  Other versions are returned unchanged.
+    """
+    if set(version.split("+")) == GRT_COMPONENTS:
+        return "GRT"
+    return version
+
+
+def generate_pipeline_profile(df: pd.DataFrame) -> list[mpl.figure.Figure]:
+    """Generate the pipeline profile: stacked per-stage wall time per subject and tool.
+
+    Each figure shows, for one subject program, one horizontal bar per (tool, time limit) pair,
+    split into the stages of a `mutation-*.sh` iteration.  This shows which stages dominate the
+    time of an experiment sweep.
+
+    Args:
+        df: Per-stage timings averaged over repeated runs (output of `average_stage_times`).
+
+    Returns:
+        One figure per subject.
+    """
+    sns.set_theme(style="whitegrid")
+    stages = list(df["Stage"].unique())
+    colors = dict(zip(stages, sns.color_palette("tab10", len(stages)), strict=True))
+    figures = []
+    for subject in df["FileName"].unique():
+        subject_data = df[df["FileName"] == subject]
+        # Keep the tools in the order of the data, and sort the time limits of each tool.
+        versions = list(subject_data["Version"].unique())
+        table = subject_data.pivot_table(
+            index=["Version", "TimeLimit"], columns="Stage", values="Seconds", fill_value=0
+        ).sort_index(
+            key=lambda level: level.map(versions.index) if level.name == "Version" else level
+        )
+        table = table[[stage for stage in stages if stage in table.columns]]
+        table.index = [
+            f"{short_version(version)} ({time_limit}s)" for version, time_limit in table.index
+        ]
+
+        fig, ax = plt.subplots(figsize=(10, 1.5 + 0.6 * len(table)))
+        table.plot(
+            kind="barh",
+            stacked=True,
+            ax=ax,
+            color=[colors[stage] for stage in table.columns],
+        )
+        fig.suptitle(f"Pipeline Profile — {subject}", fontsize=16, weight="bold")
+        ax.set_xlabel("Wall Time (s)")
+        ax.set_ylabel("GRT Component (Time Limit)")
+        ax.invert_yaxis()  # List the bars top to bottom, in the order of the table.
+        ax.legend(title="Stage", loc="center left", bbox_to_anchor=(1, 0.5))
+        fig.tight_layout()
+        figures.append(fig)
+
+    return figures
+
+
 def save_to_pdf(df: pd.DataFrame, fig_type: str):
     """Save a figure/table of the given type to a PDF file.
 
     Args:
         df: Data averaged over repeated runs (output of `average_over_loops`).
-        fig_type: One of: 'fig6-table3', 'fig7', 'fig8-9'.
+        fig_type: One of: 'fig6-table3', 'fig7', 'fig8-9', 'table4', 'pipeline-profile'.
     """
     pdf_filename = f"../results/{fig_type}.pdf"
 
@@ -347,8 +448,17 @@ def save_to_pdf(df: pd.DataFrame, fig_type: str):
             pdf.savefig(fig)
             plt.close(fig)
 
+        elif fig_type == "pipeline-profile":
+            figs = generate_pipeline_profile(df)
+            for fig in figs:
+                pdf.savefig(fig, bbox_inches="tight")
+                plt.close(fig)
+
         else:
-            print("Unknown figure type. Use one of: fig6-table3, fig7, fig8-9.")
+            print(
+                "Unknown figure type. "
+                "Use one of: fig6-table3, fig7, fig8-9, table4, pipeline-profile."
+            )
             sys.exit(1)
 
     print(f"PDF saved as '{pdf_filename}'")
@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+"""Load mutants and per-run kill outcomes into an indexed SQLite database, and query it.
+
+Each iteration of `mutation-randoop.sh` or `mutation-evosuite.sh` leaves its own result
+directory (`results/<subject>-<features>-<uuid>/`) holding Major's `mutants.log` and kill data.
+This script ingests any number of those directories into a single database with:
+
+- one row per mutant of each subject program, parsed with `trim_mutants.parse_mutant_line`, and
+- one row per run, holding the run's configuration and a compact bitmap of the mutants it killed
+  (bit `i` of the little-endian bitmap is set if mutant `i` was killed).
+
+Cross-run and cross-tool questions, such as "which mutants does GRT kill that Randoop never
+does", can then be answered from the database instead of re-parsing every result directory.
+
+Usage:
+    python mutant_db.py ingest results/
+    python mutant_db.py runs
+    python mutant_db.py unique-kills --tool GRT_VERSION --other BASELINE [--subject SUBJECT]
+        [--time-limit SECONDS]
+    python mutant_db.py kill-frequency [--subject SUBJECT] [--time-limit SECONDS]
+        [-o kill-frequency.csv]
+"""
+
+import argparse
+import csv
+import re
+import sqlite3
+import sys
+from collections import Counter
+from pathlib import Path
+
+from trim_mutants import parse_mutant_line
+
+DEFAULT_DB = Path(__file__).resolve().parent / "results" / "mutants.db"
+
+# Statuses in Major's details.csv of mutants that the tests detected.
+KILLED_STATUSES = {"FAIL", "TIME", "EXC"}
+
+# Suffix `-<uuid>` of the result directory names created by the mutation driver scripts.
+UUID_SUFFIX = re.compile(r"-[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}$")
+
+# Versions in result directory names that differ from the Version column of the results CSV.
+DIRECTORY_VERSIONS = {"EVOSUITE": "EvoSuite"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS subjects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS mutants (
+    subject_id INTEGER NOT NULL REFERENCES subjects(id),
+    mutant_no INTEGER NOT NULL,
+    operator TEXT NOT NULL,
+    method TEXT NOT NULL,
+    line TEXT NOT NULL,  -- The full mutants.log line.
+    PRIMARY KEY (subject_id, mutant_no)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS mutants_by_method ON mutants(subject_id, method);
+CREATE INDEX IF NOT EXISTS mutants_by_operator ON mutants(subject_id, operator);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    result_dir TEXT NOT NULL UNIQUE,
+    subject_id INTEGER NOT NULL REFERENCES subjects(id),
+    version TEXT NOT NULL,
+    time_limit INTEGER,
+    instruction_coverage REAL,
+    branch_coverage REAL,
+    mutation_score REAL,
+    num_killed INTEGER NOT NULL,
+    killed BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_subject_version_time_limit
+    ON runs(subject_id, version, time_limit);
+"""
+
+
+def connect(db_file):
+    """Open (and if necessary create) the mutant database.
+
+    Returns:
+        sqlite3.Connection: Connection to the database.
+    """
+    Path(db_file).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_file)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def encode_bitmap(mutant_ids):
+    """Encode a set of mutant IDs as a little-endian bitmap.
+
+    Returns:
+        bytes: Bitmap in which bit `i` is set if `i` is in `mutant_ids`.
+    """
+    bitmap = bytearray((max(mutant_ids, default=0) >> 3) + 1)
+    for mutant_id in mutant_ids:
+        bitmap[mutant_id >> 3] |= 1 << (mutant_id & 7)
+    return bytes(bitmap)
+
+
+# For each byte value, the positions of its set bits.
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+
+def decode_bitmap(bitmap):
+    """Decode a bitmap (as bytes or int) into the sorted list of mutant IDs whose bit is set.
+
+    Returns:
+        list: Mutant IDs.
+    """
+    if isinstance(bitmap, int):
+        bitmap = bitmap.to_bytes((bitmap.bit_length() + 7) >> 3, "little")
+    mutant_ids = []
+    for index, byte in enumerate(bitmap):
+        if byte:
+            base = index << 3
+            mutant_ids.extend(base + bit for bit in _BYTE_BITS[byte])
+    return mutant_ids
+
+
+def find_result_dirs(paths):
+    """Find the result directories among `paths` and their immediate subdirectories.
+
+    A result directory is one that contains a `mutants.log` file.
+
+    Returns:
+        list: Paths of result directories.
+    """
+    result_dirs = []
+    for path in map(Path, paths):
+        if (path / "mutants.log").is_file():
+            result_dirs.append(path)
+        elif path.is_dir():
+            result_dirs.extend(
+                sorted(child for child in path.iterdir() if (child / "mutants.log").is_file())
+            )
+    return result_dirs
+
+
+def read_run_info(result_dir):
+    """Determine the configuration and metrics of the run that created a result directory.
+
+    They are read from the `result.csv` file that the mutation driver scripts write to each
+    result directory.  For result directories without one, the subject program and version are
+    derived from the directory name and the other fields are None.
+
+    Returns:
+        dict: Dictionary with 'subject', 'version', 'time_limit', 'instruction_coverage',
+        'branch_coverage', and 'mutation_score' keys, or None if it cannot be determined.
+    """
+    result_csv = result_dir / "result.csv"
+    if result_csv.is_file():
+        with result_csv.open(newline="") as f:
+            row = next(csv.DictReader(f), None)
+        if row:
+            return {
+                "subject": row["FileName"].removesuffix(".jar"),
+                "version": row["Version"],
+                "time_limit": _to_number(row["TimeLimit"], int),
+                "instruction_coverage": _to_number(row["InstructionCoverage"], float),
+                "branch_coverage": _to_number(row["BranchCoverage"], float),
+                "mutation_score": _to_number(row["MutationScore"], float),
+            }
+
+    name = UUID_SUFFIX.sub("", result_dir.name)
+    if name == result_dir.name or "-" not in name:
+        return None
+    subject, version = name.rsplit("-", 1)
+    return {
+        "subject": subject,
+        "version": DIRECTORY_VERSIONS.get(version, version),
+        "time_limit": None,
+        "instruction_coverage": None,
+        "branch_coverage": None,
+        "mutation_score": None,
+    }
+
+
+def _to_number(value, number_type):
+    """Convert a CSV field to a number, or None if it is not one (e.g. "N/A")."""
+    try:
+        return number_type(value)
+    except ValueError:
+        return None
+
+
+def read_killed_mutants(result_dir):
+    """Read the IDs of the mutants killed in a run.
+
+    Kill outcomes are read from Major's `details.csv`, falling back to `killMap.csv`.
+
+    Returns:
+        set: IDs of killed mutants, or None if the run has no mutation analysis results.
+    """
+    details_csv = result_dir / "details.csv"
+    if details_csv.is_file():
+        with details_csv.open(newline="") as f:
+            rows = csv.reader(f)
+            next(rows, None)
+            return {int(row[0]) for row in rows if len(row) >= 2 and row[1] in KILLED_STATUSES}
+
+    kill_map_csv = result_dir / "killMap.csv"
+    if kill_map_csv.is_file():
+        with kill_map_csv.open(newline="") as f:
+            rows = csv.reader(f)
+            next(rows, None)
+            return {int(row[1]) for row in rows if len(row) >= 2}
+
+    return None
+
+
+def ingest_mutants(conn, subject_id, mutants_file):
+    """Load the mutant definitions of a subject program, unless they were loaded before.
+
+    Runs of the same subject program mutate the same source code, so they share mutant IDs.
+
+    Returns:
+        int: Number of mutants loaded.
+    """
+    (existing,) = conn.execute(
+        "SELECT COUNT(*) FROM mutants WHERE subject_id = ?", (subject_id,)
+    ).fetchone()
+    if existing:
+        return 0
+
+    with Path(mutants_file).open("r") as f:
+        mutants = [mutant for mutant in map(parse_mutant_line, f) if mutant]
+    conn.executemany(
+        "INSERT INTO mutants (subject_id, mutant_no, operator, method, line) "
+        "VALUES (?, ?, ?, ?, ?)",
+        ((subject_id, int(m["id"]), m["operator"], m["method"], m["line"]) for m in mutants),
+    )
+    return len(mutants)
+
+
+def ingest(conn, paths, verbose=False):
+    """Ingest result directories into the database.
+
+    Directories that were ingested before are skipped.
+
+    Args:
+        conn: Connection to the database.
+        paths: Result directories, or directories containing result directories.
+        verbose: Print a line per ingested directory.
+    """
+    ingested = 0
+    for result_dir in [d.resolve() for d in find_result_dirs(paths)]:
+        if conn.execute("SELECT 1 FROM runs WHERE result_dir = ?", (str(result_dir),)).fetchone():
+            continue
+
+        run_info = read_run_info(result_dir)
+        if run_info is None:
+            print(f"Warning: cannot determine the run of {result_dir}; skipping", file=sys.stderr)
+            continue
+        killed = read_killed_mutants(result_dir)
+        if killed is None:
+            print(f"Warning: no kill data in {result_dir}; skipping", file=sys.stderr)
+            continue
+
+        with conn:
+            conn.execute("INSERT OR IGNORE INTO subjects (name) VALUES (?)", (run_info["subject"],))
+            (subject_id,) = conn.execute(
+                "SELECT id FROM subjects WHERE name = ?", (run_info["subject"],)
+            ).fetchone()
+            num_mutants = ingest_mutants(conn, subject_id, result_dir / "mutants.log")
+            conn.execute(
+                "INSERT INTO runs (result_dir, subject_id, version, time_limit, "
+                "instruction_coverage, branch_coverage, mutation_score, num_killed, killed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(result_dir),
+                    subject_id,
+                    run_info["version"],
+                    run_info["time_limit"],
+                    run_info["instruction_coverage"],
+                    run_info["branch_coverage"],
+                    run_info["mutation_score"],
+                    len(killed),
+                    encode_bitmap(killed),
+                ),
+            )
+        ingested += 1
+
+        if verbose:
+            print(f"{result_dir}: {len(killed)} killed, {num_mutants} new mutants")
+
+    print(f"Ingested {ingested} result directories.")
+
+
+def subject_ids(conn, subject):
+    """Return the (id, name) pairs of the given subject program, or of all subject programs."""
+    if subject is None:
+        return conn.execute("SELECT id, name FROM subjects ORDER BY name").fetchall()
+    return conn.execute("SELECT id, name FROM subjects WHERE name = ?", (subject,)).fetchall()
+
+
+def select_killed(conn, subject_id, version, time_limit):
+    """Return the kill bitmaps of the runs of a version.
+
+    Args:
+        conn: Connection to the database.
+        subject_id: ID of the subject program.
+        version: Version of the runs.
+        time_limit: Time limit of the runs, or None for runs with any time limit.
+    """
+    if time_limit is None:
+        return conn.execute(
+            "SELECT killed FROM runs WHERE subject_id = ? AND version = ?", (subject_id, version)
+        ).fetchall()
+    return conn.execute(
+        "SELECT killed FROM runs WHERE subject_id = ? AND version = ? AND time_limit = ?",
+        (subject_id, version, time_limit),
+    ).fetchall()
+
+
+def kill_counts(conn, subject_id, version, time_limit=None):
+    """Count, for each mutant, the runs of a version that killed it.
+
+    Returns:
+        tuple: A Counter mapping mutant IDs to the number of runs that killed them, and the
+        number of runs.
+    """
+    counts = Counter()
+    runs = select_killed(conn, subject_id, version, time_limit)
+    for (killed,) in runs:
+        counts.update(decode_bitmap(killed))
+    return counts, len(runs)
+
+
+def killed_by_any_run(conn, subject_id, version, time_limit=None):
+    """Return the mutants killed by at least one run of a version.
+
+    Returns:
+        tuple: The bitmap, as an int, of the killed mutants, and the number of runs.
+    """
+    union = 0
+    runs = select_killed(conn, subject_id, version, time_limit)
+    for (killed,) in runs:
+        union |= int.from_bytes(killed, "little")
+    return union, len(runs)
+
+
+def check_arguments(conn, subject, versions, time_limit):
+    """Exit with an error if a subject program, version or time limit has no ingested runs."""
+    known_versions = {version for (version,) in conn.execute("SELECT DISTINCT version FROM runs")}
+    errors = [
+        f"no runs of version {version!r} (known versions: {', '.join(sorted(known_versions))})"
+        for version in versions
+        if version not in known_versions
+    ]
+    if subject is not None and not subject_ids(conn, subject):
+        errors.append(f"no subject program {subject!r}")
+    if (
+        time_limit is not None
+        and not conn.execute("SELECT 1 FROM runs WHERE time_limit = ?", (time_limit,)).fetchone()
+    ):
+        errors.append(f"no runs with a time limit of {time_limit} s")
+    if errors:
+        for error in errors:
+            print(f"Error: {error}", file=sys.stderr)
+        sys.exit(2)
+
+
+def mutant_rows(conn, subject_id, mutant_ids):
+    """Look up mutant definitions by ID.
+
+    Returns:
+        dict: Maps mutant IDs to (operator, method) pairs.
+    """
+    rows = {}
+    ids = list(mutant_ids)
+    # Stay below SQLite's limit on the number of host parameters.
+    for start in range(0, len(ids), 500):
+        chunk = ids[start : start + 500]
+        placeholders = ",".join("?" * len(chunk))
+        for mutant_no, operator, method in conn.execute(
+            "SELECT mutant_no, operator, method FROM mutants "
+            f"WHERE subject_id = ? AND mutant_no IN ({placeholders})",
+            (subject_id, *chunk),
+        ):
+            rows[mutant_no] = (operator, method)
+    return rows
+
+
+def print_runs(conn):
+    """Print the number of ingested runs per subject program, version and time limit."""
+    writer = csv.writer(sys.stdout)
+    writer.writerow(["Subject", "Version", "TimeLimit", "Runs", "AverageKilled"])
+    writer.writerows(
+        conn.execute(
+            "SELECT subjects.name, runs.version, runs.time_limit, COUNT(*), "
+            "ROUND(AVG(runs.num_killed), 2) "
+            "FROM runs JOIN subjects ON subjects.id = runs.subject_id "
+            "GROUP BY subjects.name, runs.version, runs.time_limit "
+            "ORDER BY subjects.name, runs.version, runs.time_limit"
+        )
+    )
+
+
+def write_unique_kills(conn, tool, other, subject, time_limit):
+    """Print the mutants killed by at least one run of `tool` but by no run of `other`.
+
+    Subject programs without runs of both versions are skipped with a warning, since every mutant
+    killed by `tool` would otherwise be reported as unique.
+    """
+    with_limit = "" if time_limit is None else f" with a time limit of {time_limit} s"
+    writer = csv.writer(sys.stdout)
+    writer.writerow(["Subject", "MutantNo", "Operator", "Method", "RunsKilled", "Runs"])
+    for subject_id, subject_name in subject_ids(conn, subject):
+        tool_killed, num_runs = killed_by_any_run(conn, subject_id, tool, time_limit)
+        other_killed, num_other_runs = killed_by_any_run(conn, subject_id, other, time_limit)
+        missing = [version for version, n in [(tool, num_runs), (other, num_other_runs)] if not n]
+        if missing:
+            runs = f"runs of {' or '.join(missing)}{with_limit}"
+            print(f"Warning: no {runs} for {subject_name}; skipping", file=sys.stderr)
+            continue
+
+        unique = tool_killed & ~other_killed
+        if not unique:
+            continue
+        counts, num_runs = kill_counts(conn, subject_id, tool, time_limit)
+        mutant_ids = decode_bitmap(unique)
+        mutants = mutant_rows(conn, subject_id, mutant_ids)
+        for mutant_id in mutant_ids:
+            operator, method = mutants.get(mutant_id, ("", ""))
+            writer.writerow(
+                [subject_name, mutant_id, operator, method, counts[mutant_id], num_runs]
+            )
+
+
+def write_kill_frequency(conn, subject, time_limit, output):
+    """Write, for each mutant, version and time limit, the number of runs that killed the mutant.
+
+    Runs ingested without a time limit form a group of their own, with an empty TimeLimit.
+    """
+    writer = csv.writer(output)
+    writer.writerow(
+        ["Subject", "Version", "TimeLimit", "MutantNo", "Operator", "Method", "RunsKilled", "Runs"]
+    )
+    for subject_id, subject_name in subject_ids(conn, subject):
+        query = "SELECT version, time_limit, killed FROM runs WHERE subject_id = ?"
+        params = (subject_id,)
+        if time_limit is not None:
+            query += " AND time_limit = ?"
+            params += (time_limit,)
+        groups = {}
+        for version, limit, killed in conn.execute(query + " ORDER BY version, time_limit", params):
+            counts, num_runs = groups.get((version, limit), (Counter(), 0))
+            counts.update(decode_bitmap(killed))
+            groups[version, limit] = (counts, num_runs + 1)
+
+        mutants = conn.execute(
+            "SELECT mutant_no, operator, method FROM mutants WHERE subject_id = ? "
+            "ORDER BY mutant_no",
+            (subject_id,),
+        ).fetchall()
+        for (version, limit), (counts, num_runs) in groups.items():
+            writer.writerows(
+                [
+                    subject_name,
+                    version,
+                    limit,
+                    mutant_no,
+                    operator,
+                    method,
+                    counts[mutant_no],
+                    num_runs,
+                ]
+                for mutant_no, operator, method in mutants
+            )
+
+
+def main():
+    """Ingest result directories into, or query, the mutant database."""
+    parser = argparse.ArgumentParser(
+        description="Load mutants and per-run kill outcomes into an SQLite database, and query it"
+    )
+    parser.add_argument(
+        "--db",
+        default=DEFAULT_DB,
+        help="Database file (default: results/mutants.db in this directory)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = subparsers.add_parser("ingest", help="Ingest result directories")
+    ingest_parser.add_argument(
+        "paths", nargs="+", help="Result directories, or directories containing them"
+    )
+    ingest_parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Print a line per ingested directory"
+    )
+
+    subparsers.add_parser("runs", help="Print the number of runs per subject and version")
+
+    unique_parser = subparsers.add_parser(
+        "unique-kills", help="Print mutants killed by one version but never by another"
+    )
+    unique_parser.add_argument("--tool", required=True, help="Version that kills the mutants")
+    unique_parser.add_argument("--other", required=True, help="Version that never kills them")
+    unique_parser.add_argument("--subject", help="Subject program (default: all)")
+    unique_parser.add_argument(
+        "--time-limit", type=int, help="Only use runs with this time limit (default: all)"
+    )
+
+    frequency_parser = subparsers.add_parser(
+        "kill-frequency",
+        help="Print, per mutant, version and time limit, how many runs killed the mutant",
+    )
+    frequency_parser.add_argument("--subject", help="Subject program (default: all)")
+    frequency_parser.add_argument(
+        "--time-limit", type=int, help="Only use runs with this time limit (default: all)"
+    )
+    frequency_parser.add_argument("-o", "--output", help="Output CSV file (default: stdout)")
+
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    try:
+        if args.command == "ingest":
+            ingest(conn, args.paths, args.verbose)
+        elif args.command == "runs":
+            print_runs(conn)
+        elif args.command == "unique-kills":
+            check_arguments(conn, args.subject, [args.tool, args.other], args.time_limit)
+            write_unique_kills(conn, args.tool, args.other, args.subject, args.time_limit)
+        elif args.command == "kill-frequency":
+            check_arguments(conn, args.subject, [], args.time_limit)
+            if args.output:
+                with Path(args.output).open("w", newline="") as f:
+                    write_kill_frequency(conn, args.subject, args.time_limit, f)
+            else:
+                write_kill_frequency(conn, args.subject, args.time_limit, sys.stdout)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
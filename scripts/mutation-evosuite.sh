@@ -13,6 +13,7 @@
 # - `build/evosuite-tests*`: EvoSuite-created test suites.
 # - `build/bin`: Compiled tests and code.
 # - `results/$RESULTS_CSV`: CSV file containing summary statistics for each iteration (see -o flag)
+# - `results/pipeline-profile.csv`: CSV file containing the wall time of each stage of each iteration.
 # - `results/`: everything else specific to the most recent iteration.
 
 #------------------------------------------------------------------------------
@@ -455,6 +456,11 @@ for i in $(seq 1 "$NUM_LOOP"); do
   rm -rf "$RESULT_DIR"
   mkdir -p "$RESULT_DIR"
 
+  # Timing file for each iteration, holding start/end markers for each stage (see defs.sh).
+  # It is exported so that the Python scripts can record markers for their own phases.
+  export TIMING_FILE="$RESULT_DIR/timing.csv"
+  echo "Stage,Event,Timestamp" > "$TIMING_FILE"
+
   # If the REDIRECT flag is set, redirect all output to a log file.
   if [[ "$REDIRECT" -eq 1 ]]; then
     touch "$RESULT_DIR"/mutation_output.txt
@@ -471,7 +477,9 @@ for i in $(seq 1 "$NUM_LOOP"); do
     -Dreport_dir="$REPORT_DIRECTORY"
   )
 
+  stage_start generate
   "${GENERATOR_COMMAND[@]}"
+  stage_end generate
 
   # After test generation, for JSAP-2.1, we need to remove the ant.jar from the classpath
   if [[ "$SUBJECT_PROGRAM" == "JSAP-2.1" ]]; then
@@ -493,15 +501,19 @@ for i in $(seq 1 "$NUM_LOOP"); do
     echo "$MAJOR_HOME"/bin/ant -f "$SCRIPT_DIR"/program-config/"$1"/${buildfile} -Dbasedir="$SCRIPT_DIR" -Dbindir="$SCRIPT_DIR/build/bin/$FILE_SUFFIX" -Dresultdir="$RESULT_DIR" -Dmutator="mml:$MAJOR_HOME/mml/all.mml.bin" -Dsrc="$JAVA_SRC_DIR" -Dtargetdir="$COVERAGE_DIRECTORY" -Dlibdir="$SCRIPT_DIR/build/lib/$UUID" compile.jacoco
   fi
   echo
+  stage_start compile-subject
   "$MAJOR_HOME"/bin/ant -f "$SCRIPT_DIR"/program-config/"$1"/${buildfile} -Dbasedir="$SCRIPT_DIR" -Dbindir="$SCRIPT_DIR/build/bin/$FILE_SUFFIX" -Dresultdir="$RESULT_DIR" -Dmutator="mml:$MAJOR_HOME/mml/all.mml.bin" -Dsrc="$JAVA_SRC_DIR" -Dtargetdir="$COVERAGE_DIRECTORY" -Dlibdir="$SCRIPT_DIR/build/lib/$UUID" compile.mutation
   "$MAJOR_HOME"/bin/ant -f "$SCRIPT_DIR"/program-config/"$1"/${buildfile} -Dbasedir="$SCRIPT_DIR" -Dbindir="$SCRIPT_DIR/build/bin/$FILE_SUFFIX" -Dresultdir="$RESULT_DIR" -Dmutator="mml:$MAJOR_HOME/mml/all.mml.bin" -Dsrc="$JAVA_SRC_DIR" -Dtargetdir="$COVERAGE_DIRECTORY" -Dlibdir="$SCRIPT_DIR/build/lib/$UUID" compile.jacoco
+  stage_end compile-subject
 
   PYTHON_EXECUTABLE=$(command -v python3 2> /dev/null || command -v python 2> /dev/null)
   if [ -z "$PYTHON_EXECUTABLE" ]; then
     echo "Error: Python is not installed." >&2
     exit 2
   fi
+  stage_start trim-mutants
   "$PYTHON_EXECUTABLE" "$SCRIPT_DIR"/trim_mutants.py "$RESULT_DIR/mutants.log"
+  stage_end trim-mutants
 
   echo
   echo "Compiling tests..."
@@ -512,8 +524,10 @@ for i in $(seq 1 "$NUM_LOOP"); do
     echo "$MAJOR_HOME"/bin/ant -f "$SCRIPT_DIR"/program-config/"$1"/${buildfile} -Dbasedir="$SCRIPT_DIR" -Dbindir="$SCRIPT_DIR/build/bin/$FILE_SUFFIX" -Dresultdir="$RESULT_DIR" -Dtest="$TEST_DIRECTORY" -Dsrc="$JAVA_SRC_DIR" -Dtargetdir="$COVERAGE_DIRECTORY" -Dlibdir="$SCRIPT_DIR/build/lib/$UUID" compile.jacoco.tests
   fi
   echo
+  stage_start compile-tests
   "$MAJOR_HOME"/bin/ant -f "$SCRIPT_DIR"/program-config/"$1"/${buildfile} -Dbasedir="$SCRIPT_DIR" -Dbindir="$SCRIPT_DIR/build/bin/$FILE_SUFFIX" -Dresultdir="$RESULT_DIR" -Dtest="$TEST_DIRECTORY" -Dsrc="$JAVA_SRC_DIR" -Dtargetdir="$COVERAGE_DIRECTORY" -Dlibdir="$SCRIPT_DIR/build/lib/$UUID" compile.mutation.tests
   "$MAJOR_HOME"/bin/ant -f "$SCRIPT_DIR"/program-config/"$1"/${buildfile} -Dbasedir="$SCRIPT_DIR" -Dbindir="$SCRIPT_DIR/build/bin/$FILE_SUFFIX" -Dresultdir="$RESULT_DIR" -Dtest="$TEST_DIRECTORY" -Dsrc="$JAVA_SRC_DIR" -Dtargetdir="$COVERAGE_DIRECTORY" -Dlibdir="$SCRIPT_DIR/build/lib/$UUID" compile.jacoco.tests
+  stage_end compile-tests
 
   echo
   echo "Running tests with coverage..."
@@ -522,8 +536,11 @@ for i in $(seq 1 "$NUM_LOOP"); do
     echo "$MAJOR_HOME"/bin/"$ANT" -f "$SCRIPT_DIR"/program-config/"$1"/${buildfile} -Dbasedir="$SCRIPT_DIR" -Dbindir="$SCRIPT_DIR/build/bin/$FILE_SUFFIX" -Dresultdir="$RESULT_DIR" -Dtest="$TEST_DIRECTORY" -Dsrc="$JAVA_SRC_DIR" -Dtargetdir="$COVERAGE_DIRECTORY" -Dlibdir="$SCRIPT_DIR/build/lib/$UUID" test
   fi
   echo
+  stage_start coverage
   "$MAJOR_HOME"/bin/"$ANT" -f "$SCRIPT_DIR"/program-config/"$1"/${buildfile} -Dbasedir="$SCRIPT_DIR" -Dbindir="$SCRIPT_DIR/build/bin/$FILE_SUFFIX" -Dresultdir="$RESULT_DIR" -Dtest="$TEST_DIRECTORY" -Dsrc="$JAVA_SRC_DIR" -Dtargetdir="$COVERAGE_DIRECTORY" -Dlibdir="$SCRIPT_DIR/build/lib/$UUID" test
+  stage_end coverage
 
+  stage_start coverage-report
   java -jar "$JACOCO_CLI_JAR" report "$RESULT_DIR/jacoco.exec" --classfiles "$COVERAGE_DIRECTORY/classes" --sourcefiles "$JAVA_SRC_DIR" --csv "$RESULT_DIR"/report.csv
 
   # Calculate Instruction Coverage
@@ -537,13 +554,16 @@ for i in $(seq 1 "$NUM_LOOP"); do
   branch_covered=$(awk -F, 'NR>1 {sum+=$7} END {print sum}' "$RESULT_DIR"/report.csv)
   branch_coverage=$(echo "scale=4; $branch_covered / ($branch_missed + $branch_covered) * 100" | bc)
   branch_coverage=$(printf "%.2f" "$branch_coverage")
+  stage_end coverage-report
 
   # For jdom-1.0, we need to convert the generated tests from EvoSuite format to Randoop format.
   # This is because the EvoSuite runner inteferes with the bytecode manipulation done by Major,
   # resulting in a lot of methods being excluded from mutation analysis.
   # We use a Python script to convert the tests.
   if [ "$SUBJECT_PROGRAM" == "jdom-1.0" ]; then
+    stage_start convert-runners
     "$PYTHON_EXECUTABLE" "$SCRIPT_DIR"/convert_test_runners.py "$TEST_DIRECTORY" --mode evosuite-to-randoop
+    stage_end convert-runners
   fi
 
   # Run mutation analysis unless -s flag is set
@@ -555,7 +575,9 @@ for i in $(seq 1 "$NUM_LOOP"); do
       echo "$MAJOR_HOME"/bin/"$ANT" -f "$SCRIPT_DIR"/program-config/"$1"/${buildfile} -Dbasedir="$SCRIPT_DIR" -Dbindir="$SCRIPT_DIR/build/bin/$FILE_SUFFIX" -Dresultdir="$RESULT_DIR" -Dtest="$TEST_DIRECTORY" -Dlibdir="$SCRIPT_DIR/build/lib/$UUID" mutation.test
     fi
     echo
+    stage_start mutation-analysis
     "$MAJOR_HOME"/bin/"$ANT" -f "$SCRIPT_DIR"/program-config/"$1"/${buildfile} -Dbasedir="$SCRIPT_DIR" -Dbindir="$SCRIPT_DIR/build/bin/$FILE_SUFFIX" -Dresultdir="$RESULT_DIR" -Dtest="$TEST_DIRECTORY" -Dlibdir="$SCRIPT_DIR/build/lib/$UUID" mutation.test
+    stage_end mutation-analysis
 
     # Calculate Mutation Score
     mutants_generated=$(awk -F, 'NR==2 {print $2}' "$RESULT_DIR"/summary.csv)
@@ -585,6 +607,16 @@ for i in $(seq 1 "$NUM_LOOP"); do
     "Version,FileName,TimeLimit,Seed,InstructionCoverage,BranchCoverage,MutationScore" \
     "echo \"$row\""
 
+  # Also keep this iteration's row in its result directory, for `mutant_db.py`.
+  printf '%s\n%s\n' "Version,FileName,TimeLimit,Seed,InstructionCoverage,BranchCoverage,MutationScore" "$row" > "$RESULT_DIR/result.csv"
+
+  # Per-stage wall times are appended to results/pipeline-profile.csv, for the
+  # `pipeline-profile` target of `experiment-scripts/generate-grt-figures.py`.
+  append_csv \
+    "$SCRIPT_DIR/results/pipeline-profile.csv" \
+    "Version,FileName,TimeLimit,Stage,Seconds" \
+    "stage_durations \"$TIMING_FILE\" \"$Generator,$(basename "$SRC_JAR"),$LOGGED_TIME\""
+
   # Copy the test suites to results directory
   echo "Copying test suites to results directory..."
   cp -r "$TEST_DIRECTORY" "$RESULT_DIR"
@@ -0,0 +1,47 @@
+"""Record start/end markers for pipeline stages from within the Python scripts.
+
+The mutation driver scripts (`mutation-randoop.sh`, `mutation-evosuite.sh`) export `TIMING_FILE`,
+the per-run timing file in the result directory, and bracket each stage of an iteration with
+`stage_start` and `stage_end` (see `defs.sh`).  The Python scripts they invoke use `stage_timer` to
+add markers for their own phases to the same file.
+
+Each marker is a line `Stage,Event,Timestamp`, where `Event` is `start` or `end` and `Timestamp`
+is in seconds since the epoch.  Stage names written from Python have the form `<stage>:<phase>`
+(e.g. `trim-mutants:parse`), marking them as sub-stages of a stage recorded by the driver script.
+When `TIMING_FILE` is not set, for example when a script is run by hand, no markers are written.
+"""
+
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Record start and end markers for `stage` around the body of a `with` statement.
+
+    Args:
+        stage: Name of the stage, in the form `<stage>:<phase>`.
+
+    Yields:
+        Nothing; the markers are written before and after the body runs.
+    """
+    timing_file = os.environ.get("TIMING_FILE")
+    if not timing_file:
+        yield
+        return
+
+    timing_path = Path(timing_file)
+    _write_marker(timing_path, stage, "start")
+    try:
+        yield
+    finally:
+        _write_marker(timing_path, stage, "end")
+
+
+def _write_marker(timing_path: Path, stage: str, event: str) -> None:
+    """Append a single `Stage,Event,Timestamp` marker to the timing file."""
+    with timing_path.open("a", encoding="utf-8") as f:
+        f.write(f"{stage},{event},{time.time():.6f}\n")
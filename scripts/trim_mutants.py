@@ -12,6 +12,8 @@ import sys
 from collections import defaultdict
 from pathlib import Path
 
+from stage_timer import stage_timer
+
 
 def parse_mutant_line(line):
     """Parse a mutant line and extract key information.
@@ -112,7 +114,8 @@ def trim_mutants(input_file, output_file, max_per_method=3, verbose=False):
         verbose: Print statistics
     """
     # Group mutants by method
-    method_mutants = group_mutants_by_method(input_file)
+    with stage_timer("trim-mutants:parse"):
+        method_mutants = group_mutants_by_method(input_file)
 
     if verbose:
         total_original = sum(len(mutants) for mutants in method_mutants.values())
@@ -121,23 +124,24 @@ def trim_mutants(input_file, output_file, max_per_method=3, verbose=False):
         print(f"Max mutants per method: {max_per_method}")
 
     # Select mutants to keep
-    selected_mutants = []
-    all_mutants = []
-    for method, mutants in sorted(method_mutants.items()):
-        diverse_mutants = select_diverse_mutants(mutants, max_per_method)
-        selected_mutants.extend(diverse_mutants)
-        all_mutants.extend(mutants)
-
-        if verbose and len(mutants) > max_per_method:
-            print(f"  {method}: {len(mutants)} -> {len(diverse_mutants)}")
-
-    # Determine which mutants to exclude (all mutants NOT selected)
-    selected_ids = {int(m["id"]) for m in selected_mutants}
-    all_ids = {int(m["id"]) for m in all_mutants}
-    excluded_ids = sorted(all_ids - selected_ids)
+    with stage_timer("trim-mutants:select"):
+        selected_mutants = []
+        all_mutants = []
+        for method, mutants in sorted(method_mutants.items()):
+            diverse_mutants = select_diverse_mutants(mutants, max_per_method)
+            selected_mutants.extend(diverse_mutants)
+            all_mutants.extend(mutants)
+
+            if verbose and len(mutants) > max_per_method:
+                print(f"  {method}: {len(mutants)} -> {len(diverse_mutants)}")
+
+        # Determine which mutants to exclude (all mutants NOT selected)
+        selected_ids = {int(m["id"]) for m in selected_mutants}
+        all_ids = {int(m["id"]) for m in all_mutants}
+        excluded_ids = sorted(all_ids - selected_ids)
 
     # Write excluded mutant IDs to file
-    with Path(output_file).open("w") as f:
+    with stage_timer("trim-mutants:write"), Path(output_file).open("w") as f:
         f.writelines(f"{mutant_id}\n" for mutant_id in excluded_ids)
 
     if verbose: